@@ -121,11 +121,11 @@ DOCS = [
 ]
 
 # -----------------------------
-# 4) Build prompts (rules + text)
+# 4) Build prompts (per-doc text only)
+#    RULES + schema are sent once as the model's system prompt (see step 5)
 # -----------------------------
 def build_prompt(doc):
     return (
-        f"{RULES}\n\n"
         f"Document (doc_id={doc['doc_id']}):\n"
         f"{doc['text']}\n\n"
         f"Return JSON now."
@@ -145,53 +145,48 @@ cfg = factory.ModelConfig(
         "temperature": 0.1,             # conservative for extraction
         "max_output_tokens": 1024,
         "response_schema": SCHEMA_HINT, # steer toward JSON
-        "structured_output": True
+        "structured_output": True,
+        "system_prompt": RULES,         # schema steering is appended by the provider
     },
 )
 model = factory.create_model(cfg)
 
 # -----------------------------
-# 6) Run inference
+# 6) Run inference, streaming each result straight to JSONL
 # -----------------------------
 print("Running extraction...")
-results = []
-for doc, outputs in zip(DOCS, model.infer(PROMPTS)):
-    raw = outputs[0].output
-    # Best-effort JSON parse; if not valid JSON, wrap as _raw
-    try:
-        parsed = json.loads(raw)
-    except Exception:
-        parsed = {"entities": [], "relationships": [], "_raw": raw}
-
-    # Ensure provenance included
-    parsed.setdefault("provenance", {})
-    parsed["provenance"]["doc_id"] = doc["doc_id"]
-
-    # Optional: quick normalization (dedupe entity ids)
-    seen_ids = set()
-    norm_entities = []
-    for ent in parsed.get("entities", []):
-        eid = ent.get("id")
-        if eid and eid not in seen_ids:
-            seen_ids.add(eid)
-            norm_entities.append(ent)
-    parsed["entities"] = norm_entities
-
-    # Optional: filter relationships to existing entity ids
-    valid_ids = {e.get("id") for e in parsed["entities"] if e.get("id")}
-    norm_rels = []
-    for rel in parsed.get("relationships", []):
-        if rel.get("source") in valid_ids and rel.get("target") in valid_ids:
-            norm_rels.append(rel)
-    parsed["relationships"] = norm_rels
-
-    results.append(parsed)
-
-# -----------------------------
-# 7) Write JSONL export
-# -----------------------------
+written = 0
 with open(EXPORT_PATH, "w", encoding="utf-8") as f:
-    for obj in results:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-
-print(f"✅ Wrote {len(results)} objects to {EXPORT_PATH}")
+    for doc, outputs in zip(DOCS, model.infer(PROMPTS)):
+        raw = outputs[0].output
+        # The provider already decoded (and schema-checked) valid responses;
+        # otherwise best-effort JSON parse, and if not valid JSON, wrap as _raw
+        parsed = outputs[0].parsed
+        if parsed is None:
+            try:
+                parsed = json.loads(raw)
+            except Exception:
+                parsed = {"entities": [], "relationships": [], "_raw": raw}
+
+        # Ensure provenance included
+        parsed.setdefault("provenance", {})
+        parsed["provenance"]["doc_id"] = doc["doc_id"]
+
+        # Optional: quick normalization (dedupe entity ids, first mention wins)
+        entities_by_id = {}
+        for ent in parsed.get("entities", []):
+            if ent.get("id"):
+                entities_by_id.setdefault(ent["id"], ent)
+        parsed["entities"] = list(entities_by_id.values())
+
+        # Optional: filter relationships to existing entity ids
+        valid_ids = entities_by_id.keys()
+        parsed["relationships"] = [
+            rel for rel in parsed.get("relationships", [])
+            if rel.get("source") in valid_ids and rel.get("target") in valid_ids
+        ]
+
+        f.write(json.dumps(parsed, ensure_ascii=False) + "\n")
+        written += 1
+
+print(f"✅ Wrote {written} objects to {EXPORT_PATH}")
@@ -1,13 +1,16 @@
-# langextract_bedrock/__init__.py
 import os
-from dotenv import load_dotenv
 
-# Load your .env automatically when the plugin loads
-load_dotenv()
+# Load your .env automatically when the plugin loads (rules: README "Environment Setup")
+# AWS settings the plugin itself reads from the environment
+_DOTENV_VARS = ("AWS_REGION", "AWS_PROFILE")
+if not os.environ.get("LANGEXTRACT_BEDROCK_SKIP_DOTENV") and not all(
+    v in os.environ for v in _DOTENV_VARS
+):
+    from dotenv import load_dotenv
+    load_dotenv()
 
-# Default environment fallbacks for Bedrock region/profile
+# Default environment fallback for Bedrock region (the profile has no sane default)
 os.environ.setdefault("AWS_REGION", os.getenv("AWS_REGION", "us-west-2"))
-os.environ.setdefault("AWS_PROFILE", os.getenv("AWS_PROFILE", None))
 
 # Export the provider class so LangExtract's entry point can find it
-from .provider import BedrockLanguageModel
+from .provider import BedrockLanguageModel, BedrockScoredOutput, CACHEPOINT
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+# Default on-disk location, shared by every model/process on the machine.
+# Entries are keyed by model id + prompt + sampling params, so they never collide.
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "langextract_bedrock", "responses.sqlite3"
+)
+
+# seconds a connection waits on another process's write lock before giving up
+_LOCK_TIMEOUT = 30.0
+
+# ResponseCache instances keyed by resolved path, see shared_cache
+_CACHES: Dict[str, "ResponseCache"] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def make_key(*parts) -> str:
+    """
+    Stable sha256 key over everything that affects the model's answer.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """
+    Exact-match prompt -> response cache backed by SQLite.
+    Lets repeated extraction jobs skip the Bedrock round-trip entirely.
+    Pass path=":memory:" for a process-local cache that isn't persisted.
+    A cache is only an optimization, so lookup/store errors (e.g. the file
+    stays locked by another process) count as a miss / skipped store.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_CACHE_PATH
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # one connection shared across infer() worker threads, guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=_LOCK_TIMEOUT, check_same_thread=False)
+        with self._lock, self._conn:
+            # WAL lets readers in other processes proceed while one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, response),
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def shared_cache(path: Optional[str] = None) -> ResponseCache:
+    """
+    Return the process-wide ResponseCache for `path` (default file if None),
+    opening it on first use, so model instances reuse one connection per
+    file instead of each opening (and never closing) their own.
+    """
+    path = path or DEFAULT_CACHE_PATH
+    key = path if path == ":memory:" else os.path.abspath(path)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = ResponseCache(path)
+    return cache
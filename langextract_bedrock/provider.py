@@ -1,32 +1,123 @@
+import asyncio
+import dataclasses
 import json
 import os
 import re
-from typing import Iterable, List, Dict, Any, Generator
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Dict, Any, Generator, Optional, Tuple, Union
 
-import boto3
+import fastjsonschema
 import langextract as lx
+import orjson
 from langextract.core.base_model import BaseLanguageModel
 from langextract.core.types import ScoredOutput
+
+from .cache import make_key, shared_cache
 # Examples of model id patterns Bedrock hosts (vendor prefixes optional in your UX):
 #   anthropic.claude-3-5-sonnet-20240620-v1:0
 #   mistral.mistral-large-2407-v1:0
 #   cohere.command-r-plus-v1:0
 #   meta.llama3-8b-instruct-v1:0
 #   amazon.titan-text-lite-v1
+#   us.anthropic.claude-3-7-sonnet-20250219-v1:0  (cross-region inference profile)
 #
 # We’ll accept either:
 #   model_id="bedrock:anthropic.claude-3-5-sonnet-20240620-v1:0"
 # or just the raw Bedrock model ID; patterns below catch both.
 
+# Put this marker in a prompt to split it into a reusable (cached) prefix and a
+# per-call tail, e.g. f"{RULES}{CACHEPOINT}{doc_text}". On Anthropic models the
+# prefix is followed by a Converse `cachePoint` block so Bedrock can reuse its
+# prefill across calls (the prefix must meet the model's minimum cacheable length to be cached).
+# Other vendors don't support cache points; the marker is simply dropped.
+# In `system_prompt` the marker opts the whole system message into caching.
+CACHEPOINT = "<<CACHEPOINT>>"
+
+# geo prefix of cross-region inference-profile IDs (us./eu./apac./us-gov./global.),
+# ignored when detecting the vendor
+_GEO_PREFIX_RE = re.compile(r'^(?:us|eu|apac|us-gov|global)\.')
+
+# model-id prefix (after any geo prefix) -> vendor branch; anything unmatched is "generic"
+_VENDOR_PREFIXES = (
+    ("anthropic.", "anthropic"),
+    ("mistral.", "mistral"),
+    ("cohere.", "cohere"),
+    ("meta.llama", "llama"),
+    ("amazon.titan", "titan"),
+)
+
+# Registry patterns, compiled once here and handed to the registry as Pattern
+# objects (it accepts both strings and compiled patterns)
+_BEDROCK_RE = re.compile(r'^bedrock:')  # explicit "bedrock:" prefix
+_VENDOR_RE = re.compile(
+    r'^(?:(?:us|eu|apac|us-gov|global)\.)?(anthropic|mistral|cohere|meta\.llama|amazon\.titan)'
+)  # bare Bedrock IDs, optionally behind an inference-profile geo prefix
+
+# bedrock-runtime clients keyed by (aws_profile, region_name, pool size)
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str], int], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _shared_client(session_kwargs: Dict[str, Any], region_name: Optional[str], config):
+    """
+    Return the process-wide boto3 bedrock-runtime client for this profile/region,
+    creating it on first use. Saves repeating credential resolution and endpoint
+    setup per model instance; clients are thread-safe, and botocore refreshes
+    expiring (assumed-role / SSO) credentials on the cached client by itself.
+    boto3 is imported here rather than at module level since it costs a few
+    hundred ms and isn't needed just to register the provider.
+    """
+    key = (session_kwargs.get("profile_name"), region_name, config.max_pool_connections)
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            import boto3
+
+            session = boto3.Session(**session_kwargs)
+            client = session.client("bedrock-runtime", region_name=region_name, config=config)
+            _CLIENT_CACHE[key] = client
+    return client
+
+
+# fastjsonschema validators keyed by the schema's JSON text (None if it won't compile)
+_VALIDATOR_CACHE: Dict[str, Optional[Callable[[Any], Any]]] = {}
+_VALIDATOR_LOCK = threading.Lock()
+
+
+def _schema_validator(schema_text: str, schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the process-wide compiled validator for a response schema.
+    fastjsonschema.compile generates and execs Python code, which costs
+    milliseconds, so it runs once per schema rather than per model instance.
+    """
+    with _VALIDATOR_LOCK:
+        if schema_text not in _VALIDATOR_CACHE:
+            try:
+                _VALIDATOR_CACHE[schema_text] = fastjsonschema.compile(schema)
+            except fastjsonschema.JsonSchemaDefinitionException:
+                _VALIDATOR_CACHE[schema_text] = None
+        return _VALIDATOR_CACHE[schema_text]
+
+
+@dataclasses.dataclass(frozen=True)
+class BedrockScoredOutput(ScoredOutput):
+    """
+    ScoredOutput plus the decoded JSON object when structured output
+    validated, so callers don't have to json.loads `output` again.
+    """
+    parsed: Any = None
+
+
 @lx.providers.registry.register(
-    r'^bedrock:',                     # explicit "bedrock:" prefix
-    r'^(anthropic|mistral|cohere|meta\.llama|amazon\.titan)',  # bare Bedrock IDs
+    _BEDROCK_RE,
+    _VENDOR_RE,
     priority=10
 )
 class BedrockLanguageModel(BaseLanguageModel):
     """
     LangExtract provider for AWS Bedrock via boto3 `bedrock-runtime`.
-    Supports multiple vendors by inspecting the model_id prefix.
+    Talks to every vendor through the Bedrock Converse API.
     """
 
     def __init__(
@@ -41,18 +132,48 @@ class BedrockLanguageModel(BaseLanguageModel):
         # schema knobs passed by LangExtract (soft-enforced here)
         response_schema: Dict[str, Any] = None,
         structured_output: bool = False,
+        # max number of in-flight Bedrock calls per infer() batch
+        max_concurrency: int = 8,
+        # Bedrock latency-optimized inference; only honored on the
+        # allow-listed models (e.g. Claude 3.5 Haiku, Llama 3.1 70B/405B)
+        latency_optimized: bool = False,
+        # local prompt->response cache: True for the default SQLite file
+        # under ~/.cache/langextract_bedrock/, or a path (":memory:" ok)
+        response_cache: Union[bool, str] = False,
+        # shared preamble (rules, schema steering) sent as the system message
+        # instead of being repeated inside every prompt
+        system_prompt: Optional[str] = None,
+        # run batches on aioboto3 coroutines instead of a thread pool
+        # (needs the optional extra: pip install "langextract-bedrock[async]")
+        use_async: bool = False,
+        # use converse_stream so decoding overlaps generation
+        stream: bool = False,
+        # pack up to this many short prompts into one call (1 = off); prompts
+        # longer than micro_batch_max_chars are always sent on their own
+        micro_batch_size: int = 1,
+        micro_batch_max_chars: int = 2000,
         **kwargs
     ):
         super().__init__()
         # normalize model id (strip optional "bedrock:" prefix)
-        self.raw_model_id = re.sub(r'^bedrock:', '', model_id)
+        self.raw_model_id = model_id.removeprefix("bedrock:")
+
+        self.max_concurrency = max(1, int(max_concurrency))
+
+        # Auth / client (shared across instances, see _shared_client)
+        from botocore.config import Config
 
-        # Auth / client
         session_kwargs = {}
         if aws_profile:
             session_kwargs["profile_name"] = aws_profile
-        session = boto3.Session(**session_kwargs)
-        self.client = session.client("bedrock-runtime", region_name=region_name)
+        self.client = _shared_client(session_kwargs, region_name, self._client_config(Config))
+        # also used for the aioboto3 client, which is opened per async batch
+        self._session_kwargs = session_kwargs
+        self.region_name = region_name
+        self.use_async = use_async
+        self.stream = stream
+        self.micro_batch_size = max(1, int(micro_batch_size))
+        self.micro_batch_max_chars = micro_batch_max_chars
 
         self.temperature = temperature
         self.max_tokens = max_output_tokens
@@ -60,21 +181,88 @@ class BedrockLanguageModel(BaseLanguageModel):
 
         self.response_schema = response_schema
         self.structured_output = structured_output
-
-        # detect vendor branch
-        if self.raw_model_id.startswith("anthropic."):
-            self._vendor = "anthropic"
-        elif self.raw_model_id.startswith("mistral."):
-            self._vendor = "mistral"
-        elif self.raw_model_id.startswith("cohere."):
-            self._vendor = "cohere"
-        elif self.raw_model_id.startswith("meta.llama"):
-            self._vendor = "llama"
-        elif self.raw_model_id.startswith("amazon.titan"):
-            self._vendor = "titan"
+        # the schema never changes, so serialize it (and the steering text
+        # built from it) once. With a system prompt the steering lives there;
+        # otherwise it becomes a fixed preamble for each prompt
+        self._schema_text = json.dumps(response_schema) if response_schema else None
+        # a CACHEPOINT in the system prompt opts the whole system message into
+        # prompt caching (Anthropic only; the model must support caching and the
+        # text must meet its minimum cacheable length, else Bedrock rejects it)
+        self._cache_system = bool(system_prompt) and CACHEPOINT in system_prompt
+        if self._cache_system:
+            system_prompt = system_prompt.replace(CACHEPOINT, "")
+        self.system_prompt = system_prompt
+        self._task_preamble = None
+        if structured_output and response_schema:
+            # a micro-batch asks for an array of answers, which a system
+            # instruction demanding one object would contradict; the schema
+            # then goes with each prompt / batch prompt instead
+            if system_prompt and self.micro_batch_size <= 1:
+                self.system_prompt = f"{system_prompt.rstrip()}\n\n{self._schema_instruction()}"
+            else:
+                self._task_preamble = f"{self._schema_instruction()}\n\nTask:\n"
+        # compiled once per distinct schema (see _schema_validator); it's only
+        # a "hint" schema, so fall back to plain JSON checks if it won't compile
+        self._validator = None
+        if structured_output and response_schema:
+            self._validator = _schema_validator(self._schema_text, response_schema)
+        self.performance_config = {"latency": "optimized"} if latency_optimized else None
+        if response_cache:
+            self.response_cache = shared_cache(
+                response_cache if isinstance(response_cache, str) else None
+            )
         else:
-            # fallback: try to infer from model name tokens
-            self._vendor = "generic"
+            self.response_cache = None
+
+        # detect vendor branch (newer models are only reachable through
+        # inference-profile IDs like "us.anthropic....", so skip the geo prefix)
+        base_id = _GEO_PREFIX_RE.sub("", self.raw_model_id, count=1)
+        self._vendor = next(
+            (v for p, v in _VENDOR_PREFIXES if base_id.startswith(p)), "generic"
+        )
+        # Converse handles the request shape; the vendor only decides features.
+        # Cache points and the system field are used on Anthropic, where both
+        # are supported (support varies across the other vendors' models)
+        self._cache_points = self._vendor == "anthropic"
+        self._system_blocks = None
+        if self.system_prompt and self._vendor == "anthropic":
+            self._system_blocks = [{"text": self.system_prompt}]
+            if self._cache_system:
+                self._system_blocks.append({"cachePoint": {"type": "default"}})
+        # system prompts aren't supported by every Converse model, so outside
+        # Anthropic it's sent as part of the user text
+        self._inline_system = ""
+        if self.system_prompt and not self._system_blocks:
+            self._inline_system = f"{self.system_prompt}\n\n"
+
+        # everything in a Converse request except the user message is fixed
+        # for this instance: build it once, and per call only add `messages`
+        self._converse_base = dict(
+            modelId=self.raw_model_id,
+            inferenceConfig={
+                "maxTokens": self.max_tokens,
+                "temperature": self.temperature,
+                "topP": self.top_p,
+            },
+        )
+        if self._system_blocks:
+            self._converse_base["system"] = self._system_blocks
+        if self.performance_config:
+            self._converse_base["performanceConfig"] = self.performance_config
+
+    def _client_config(self, config_cls):
+        """
+        Client tuning shared by the boto3 and aioboto3 clients: a connection
+        pool big enough for max_concurrency (default is 10) so requests don't
+        queue or re-handshake, keep-alive, adaptive retries for throttling,
+        and a read timeout that fits long generations.
+        """
+        return config_cls(
+            max_pool_connections=max(32, self.max_concurrency * 2),
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+            read_timeout=120,
+        )
 
     @classmethod
     def get_schema_class(cls):
@@ -88,120 +276,303 @@ class BedrockLanguageModel(BaseLanguageModel):
         # via kwargs but don’t construct it ourselves.
         return None
 
+    def _schema_instruction(self) -> str:
+        """
+        Steering text asking for strict JSON matching `response_schema`.
+        """
+        return (
+            "Return ONLY valid JSON that matches this schema. "
+            "Do not include explanations.\n"
+            f"Schema (JSON Schema-ish hint): {self._schema_text}"
+        )
+
     def _prompt_for_schema(self, prompt: str) -> str:
         """
         If structured_output=True but vendor lacks native JSON schema,
         we steer with instruction + ask for strict JSON.
+        Skipped when the system prompt already carries the instruction.
         """
-        if self.structured_output and self.response_schema:
-            return (
-                "Return ONLY valid JSON that matches this schema. "
-                "Do not include explanations.\n"
-                f"Schema (JSON Schema-ish hint): {json.dumps(self.response_schema) }\n\n"
-                f"Task:\n{prompt}"
-            )
+        if self._task_preamble:
+            return self._task_preamble + prompt
         return prompt
 
-    def _invoke_anthropic(self, prompt: str) -> str:
+    def _converse_kwargs(self, prompt: str) -> Dict[str, Any]:
         """
-        Bedrock Anthropic Messages format.
+        Bedrock Converse request for a prompt. Converse gives every vendor
+        (Anthropic, Mistral, Cohere, Llama, Titan, ...) the same request and
+        response shape; used for converse / converse_stream on both clients.
         """
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "messages": [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "top_p": self.top_p
-        }
-        resp = self.client.invoke_model(
-            modelId=self.raw_model_id,
-            contentType="application/json",
-            accept="application/json",
-            body=json.dumps(body)
+        prefix, marker, tail = prompt.partition(CACHEPOINT)
+        if marker and prefix and self._cache_points:
+            content = [{"text": prefix}, {"cachePoint": {"type": "default"}}]
+            if tail:
+                content.append({"text": tail})
+        else:
+            content = [{"text": self._inline_system + prefix + tail}]
+        return dict(self._converse_base, messages=[{"role": "user", "content": content}])
+
+    @staticmethod
+    def _converse_text(resp: Dict[str, Any]) -> str:
+        # output message holds a list of content blocks; join the text ones
+        blocks = resp["output"]["message"]["content"]
+        return "".join(b.get("text", "") for b in blocks).strip()
+
+    @staticmethod
+    def _stream_delta(event: Dict[str, Any]) -> str:
+        # converse_stream: generated text arrives in contentBlockDelta events
+        delta = event.get("contentBlockDelta")
+        return delta["delta"].get("text", "") if delta else ""
+
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Response-cache key: everything that changes what the model would return.
+        """
+        return make_key(
+            self.raw_model_id, self.system_prompt, prompt,
+            self.temperature, self.max_tokens, self.top_p,
         )
-        payload = json.loads(resp["body"].read())
-        # Anthropic returns list of content blocks; pick the first text
-        parts = payload.get("content", [])
-        text = ""
-        for p in parts:
-            if p.get("type") == "text":
-                text += p.get("text", "")
-        return text.strip()
-
-    def _invoke_mistral(self, prompt: str) -> str:
-        """
-        Bedrock Mistral format (chat).
-        """
-        body = {
-            "prompt": prompt,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "top_p": self.top_p
-        }
-        resp = self.client.invoke_model(
-            modelId=self.raw_model_id,
-            contentType="application/json",
-            accept="application/json",
-            body=json.dumps(body)
+
+    def _check_structured(self, text: str) -> Tuple[str, Any]:
+        """
+        Optional: strict post-validation if structured_output=True.
+        Returns (text, parsed JSON or None).
+        """
+        if not (self.structured_output and self.response_schema):
+            return text, None
+        try:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # If invalid JSON, wrap in best-effort object
+            return json.dumps({"_raw": text, "_error": "Invalid JSON for requested schema"}), None
+        if self._validator is not None:
+            try:
+                self._validator(parsed)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return json.dumps({"_raw": text, "_error": f"Schema validation failed: {e.message}"}), None
+        return text, parsed
+
+    def _invoke_text(self, prompt: str) -> str:
+        """
+        One Bedrock round-trip for a prompt, returning the model's text.
+        With stream=True the response is consumed chunk by chunk as it arrives.
+        """
+        kwargs = self._converse_kwargs(prompt)
+        if not self.stream:
+            return self._converse_text(self.client.converse(**kwargs))
+        resp = self.client.converse_stream(**kwargs)
+        return "".join(self._stream_delta(e) for e in resp["stream"]).strip()
+
+    async def _ainvoke_text(self, client, prompt: str) -> str:
+        """
+        Async twin of _invoke_text on an aioboto3 bedrock-runtime client.
+        """
+        kwargs = self._converse_kwargs(prompt)
+        if not self.stream:
+            return self._converse_text(await client.converse(**kwargs))
+        resp = await client.converse_stream(**kwargs)
+        parts = []
+        async for event in resp["stream"]:
+            parts.append(self._stream_delta(event))
+        return "".join(parts).strip()
+
+    def _cached_text(self, prompt: str) -> Tuple[str, Optional[str]]:
+        """
+        Model text for a final prompt, served from the response cache when possible.
+        Returns (text, key): key is set when the text came from Bedrock and may be
+        stored with _cache_put once the caller has checked it, else None.
+        Safe to call from worker threads: boto3 clients are thread-safe.
+        """
+        if self.response_cache is None:
+            return self._invoke_text(prompt), None
+        key = self._cache_key(prompt)
+        text = self.response_cache.get(key)
+        if text is not None:
+            return text, None
+        return self._invoke_text(prompt), key
+
+    async def _acached_text(self, client, sem: asyncio.Semaphore, prompt: str) -> Tuple[str, Optional[str]]:
+        """
+        Async twin of _cached_text; `sem` bounds the calls actually in flight.
+        """
+        key = None
+        if self.response_cache is not None:
+            key = self._cache_key(prompt)
+            text = self.response_cache.get(key)
+            if text is not None:
+                return text, None
+        async with sem:
+            text = await self._ainvoke_text(client, prompt)
+        return text, key
+
+    def _cache_put(self, key: Optional[str], text: str, results: List[Tuple[str, Any]]) -> None:
+        """
+        Store a fresh response, but only if every result built from it passed
+        the structured-output check; a bad answer would otherwise be replayed
+        from the cache on every later run instead of asking Bedrock again.
+        """
+        if key is None:
+            return
+        if self.structured_output and self.response_schema:
+            # _check_structured leaves `parsed` unset exactly when it failed
+            if any(parsed is None for _, parsed in results):
+                return
+        self.response_cache.put(key, text)
+
+    def _plan_groups(self, prompts: List[str]) -> List[List[str]]:
+        """
+        Split a batch into per-call groups, keeping input order. With
+        micro_batch_size > 1, consecutive short prompts share one call;
+        prompts over micro_batch_max_chars always go alone, as do prompts
+        with a CACHEPOINT (batching them would drop their cached prefix).
+        """
+        if self.micro_batch_size <= 1:
+            return [[p] for p in prompts]
+        groups, current = [], []
+        for p in prompts:
+            if len(p) > self.micro_batch_max_chars or CACHEPOINT in p:
+                if current:
+                    groups.append(current)
+                    current = []
+                groups.append([p])
+                continue
+            current.append(p)
+            if len(current) == self.micro_batch_size:
+                groups.append(current)
+                current = []
+        if current:
+            groups.append(current)
+        return groups
+
+    def _micro_batch_prompt(self, prompts: List[str]) -> str:
+        """
+        One prompt asking for a JSON array with an answer per numbered task.
+        """
+        n = len(prompts)
+        if self.structured_output and self.response_schema:
+            shape = f"a JSON object answering that task that matches this schema: {self._schema_text}"
+        else:
+            shape = "a JSON string containing the answer to that task"
+        tasks = "\n\n".join(
+            f"Task {i}:\n{p}" for i, p in enumerate(prompts, 1)
         )
-        payload = json.loads(resp["body"].read())
-        # Mistral on Bedrock returns {"outputs": [{"text": "..."}], ...}
-        outputs = payload.get("outputs", [])
-        return (outputs[0].get("text", "") if outputs else "").strip()
-
-    def _invoke_generic(self, prompt: str) -> str:
-        """
-        Fallback for other Bedrock text models (Cohere, Llama, Titan).
-        Most accept a similar request with 'prompt' or 'inputText'.
-        You can extend with vendor-specific branches as needed.
-        """
-        # try generic "prompt"
-        body = {
-            "prompt": prompt,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "top_p": self.top_p
-        }
-        resp = self.client.invoke_model(
-            modelId=self.raw_model_id,
-            contentType="application/json",
-            accept="application/json",
-            body=json.dumps(body)
+        return (
+            f"Answer each of the {n} numbered tasks below independently. "
+            f"Return ONLY a JSON array with exactly {n} elements in task order, "
+            f"each element {shape}. Do not include explanations.\n\n{tasks}"
         )
-        payload = json.loads(resp["body"].read())
-        # Cohere: {"generations":[{"text": "..."}]}
-        if "generations" in payload and payload["generations"]:
-            return payload["generations"][0].get("text", "").strip()
-        # Titan / Llama often: {"results":[{"outputText":"..."}]} or {"outputs":[{"text":"..."}]}
-        if "results" in payload and payload["results"]:
-            return payload["results"][0].get("outputText", "").strip()
-        if "outputs" in payload and payload["outputs"]:
-            return payload["outputs"][0].get("text", "").strip()
-        # last resort
-        return payload.get("outputText", "").strip()
-
-    def infer(self, batch_prompts: Iterable[str], **kwargs) -> Generator[List[ScoredOutput], None, None]:
+
+    @staticmethod
+    def _split_micro_batch(text: str, n: int) -> Optional[List[str]]:
+        """
+        Per-task answers from a micro-batch response, or None if it isn't a
+        JSON array of exactly n elements.
+        """
+        try:
+            items = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(items, list) or len(items) != n:
+            return None
+        return [i if isinstance(i, str) else json.dumps(i) for i in items]
+
+    def _invoke_single(self, prompt: str) -> Tuple[str, Any]:
+        """
+        Result for one prompt sent on its own.
+        """
+        text, key = self._cached_text(self._prompt_for_schema(prompt))
+        result = self._check_structured(text)
+        self._cache_put(key, text, [result])
+        return result
+
+    def _invoke_group(self, group: List[str]) -> Optional[List[Tuple[str, Any]]]:
+        """
+        Results for one group from _plan_groups, in order, or None when a
+        micro-batch answer can't be split back up; the caller then retries
+        the group's prompts one per call (concurrently, not in this worker).
+        """
+        if len(group) == 1:
+            return [self._invoke_single(group[0])]
+        text, key = self._cached_text(self._micro_batch_prompt(group))
+        answers = self._split_micro_batch(text, len(group))
+        if answers is None:
+            return None
+        results = [self._check_structured(a) for a in answers]
+        self._cache_put(key, text, results)
+        return results
+
+    async def _ainvoke_single(self, client, sem: asyncio.Semaphore, prompt: str) -> Tuple[str, Any]:
+        """
+        Async twin of _invoke_single.
+        """
+        text, key = await self._acached_text(client, sem, self._prompt_for_schema(prompt))
+        result = self._check_structured(text)
+        self._cache_put(key, text, [result])
+        return result
+
+    async def _ainvoke_group(self, client, sem: asyncio.Semaphore, group: List[str]) -> List[Tuple[str, Any]]:
+        """
+        Async twin of _invoke_group; a failed micro-batch is retried here,
+        with the per-prompt calls gathered concurrently.
+        """
+        if len(group) > 1:
+            text, key = await self._acached_text(client, sem, self._micro_batch_prompt(group))
+            answers = self._split_micro_batch(text, len(group))
+            if answers is not None:
+                results = [self._check_structured(a) for a in answers]
+                self._cache_put(key, text, results)
+                return results
+        return await asyncio.gather(*(self._ainvoke_single(client, sem, p) for p in group))
+
+    async def _ainfer(self, groups: List[List[str]]) -> List[List[Tuple[str, Any]]]:
+        """
+        Run a whole batch on one aioboto3 client, at most `max_concurrency` in flight.
+        """
+        import aioboto3  # optional extra: pip install "langextract-bedrock[async]"
+        from aiobotocore.config import AioConfig
+
+        sem = asyncio.Semaphore(self.max_concurrency)
+        session = aioboto3.Session(**self._session_kwargs)
+        async with session.client(
+            "bedrock-runtime", region_name=self.region_name, config=self._client_config(AioConfig)
+        ) as client:
+            return await asyncio.gather(*(self._ainvoke_group(client, sem, g) for g in groups))
+
+    def _run_async(self, groups: List[List[str]]) -> List[List[Tuple[str, Any]]]:
+        """
+        asyncio.run the batch; if this thread already runs an event loop
+        (e.g. Jupyter), do it on a helper thread instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._ainfer(groups))
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            return ex.submit(asyncio.run, self._ainfer(groups)).result()
+
+    def infer(self, batch_prompts: Iterable[str], **kwargs) -> Generator[List[BedrockScoredOutput], None, None]:
         """
         LangExtract contract: yield a list of ScoredOutput per prompt.
-        We don’t stream here; you can add streaming later if needed.
-        """
-        for p in batch_prompts:
-            prompt = self._prompt_for_schema(p)
-            if self._vendor == "anthropic":
-                text = self._invoke_anthropic(prompt)
-            elif self._vendor == "mistral":
-                text = self._invoke_mistral(prompt)
-            else:
-                text = self._invoke_generic(prompt)
-
-            # Optional: strict post-validation if structured_output=True
-            if self.structured_output and self.response_schema:
-                try:
-                    # Minimal: ensure it’s valid JSON; enforce your own schema validator if desired
-                    parsed = json.loads(text)
-                    # You can integrate jsonschema or pydantic validation here.
-                except Exception:
-                    # If invalid JSON, wrap in best-effort object
-                    text = json.dumps({"_raw": text, "_error": "Invalid JSON for requested schema"})
-
-            yield [ScoredOutput(score=1.0, output=text)]
+        Prompts are sent concurrently (up to `max_concurrency` at a time)
+        since each call is a blocking network round-trip; results are
+        yielded in input order. With use_async=True the batch runs on
+        aioboto3 coroutines instead of threads, and with micro_batch_size
+        > 1 short prompts share calls. Validated structured outputs carry
+        the decoded object in `.parsed`.
+        """
+        groups = self._plan_groups(list(batch_prompts))
+        if not groups:
+            return
+        if self.use_async:
+            for results in self._run_async(groups):
+                for text, parsed in results:
+                    yield [BedrockScoredOutput(score=1.0, output=text, parsed=parsed)]
+            return
+        # sized by prompts, not groups, so a failed micro-batch's retries can run side by side
+        workers = min(self.max_concurrency, sum(len(g) for g in groups))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for group, results in zip(groups, ex.map(self._invoke_group, groups)):
+                if results is None:
+                    # micro-batch answer didn't split: one call per prompt, concurrently
+                    results = ex.map(self._invoke_single, group)
+                for text, parsed in results:
+                    yield [BedrockScoredOutput(score=1.0, output=text, parsed=parsed)]
@@ -0,0 +1,96 @@
+import json
+import threading
+
+import pytest
+
+from langextract_bedrock import CACHEPOINT, BedrockLanguageModel
+
+
+class StubClient:
+    """
+    Stands in for the bedrock-runtime client: `reply` maps the user text
+    of a Converse request to the model's answer. Records every call.
+    """
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def converse(self, **kwargs):
+        text = "".join(b.get("text", "") for b in kwargs["messages"][0]["content"])
+        with self._lock:
+            self.prompts.append(text)
+        return {"output": {"message": {"role": "assistant", "content": [{"text": self.reply(text)}]}}}
+
+
+def make_model(**kwargs):
+    kwargs.setdefault("micro_batch_size", 3)
+    kwargs.setdefault("micro_batch_max_chars", 20)
+    return BedrockLanguageModel("bedrock:mistral.mistral-large-2407-v1:0", region_name="us-east-1", **kwargs)
+
+
+def test_plan_groups_keeps_order_and_fills_up_to_size():
+    model = make_model()
+    assert model._plan_groups(["a", "b", "c", "d", "e"]) == [["a", "b", "c"], ["d", "e"]]
+
+
+def test_plan_groups_sends_long_prompts_alone():
+    model = make_model()
+    long = "x" * 21
+    assert model._plan_groups(["a", long, "b", "c", "x" * 20]) == [["a"], [long], ["b", "c", "x" * 20]]
+
+
+def test_plan_groups_sends_cachepoint_prompts_alone():
+    model = make_model()
+    cached = f"rules{CACHEPOINT}doc"
+    assert model._plan_groups(["a", "b", cached, "c"]) == [["a", "b"], [cached], ["c"]]
+
+
+def test_plan_groups_off_by_default():
+    model = make_model(micro_batch_size=1)
+    assert model._plan_groups(["a", "b"]) == [["a"], ["b"]]
+
+
+def test_micro_batch_prompt_numbers_tasks_in_order():
+    model = make_model()
+    prompt = model._micro_batch_prompt(["first", "second"])
+    assert "exactly 2 elements" in prompt
+    assert prompt.index("Task 1:\nfirst") < prompt.index("Task 2:\nsecond")
+
+
+def test_split_micro_batch_returns_answers_as_text():
+    text = json.dumps(["plain", {"a": 1}, [1, 2]])
+    assert BedrockLanguageModel._split_micro_batch(text, 3) == ["plain", '{"a": 1}', "[1, 2]"]
+
+
+@pytest.mark.parametrize("text", [
+    json.dumps(["one", "two"]),  # wrong length
+    json.dumps({"a": 1}),  # not an array
+    "not json",
+])
+def test_split_micro_batch_rejects_bad_replies(text):
+    assert BedrockLanguageModel._split_micro_batch(text, 3) is None
+
+
+def test_infer_splits_micro_batch_answers():
+    model = make_model()
+    model.client = StubClient(lambda text: json.dumps(["A", "B", "C"]))
+    outputs = [o[0].output for o in model.infer(["a", "b", "c"])]
+    assert outputs == ["A", "B", "C"]
+    assert len(model.client.prompts) == 1
+
+
+def test_infer_falls_back_to_one_call_per_prompt():
+    def reply(text):
+        if text.startswith("Answer each"):
+            return "sorry, no JSON here"
+        return text.upper()
+
+    model = make_model()
+    model.client = StubClient(reply)
+    outputs = [o[0].output for o in model.infer(["a", "b", "c", "d"])]
+    assert outputs == ["A", "B", "C", "D"]
+    # one batch call for a/b/c, then a call each; d was alone from the start
+    assert len(model.client.prompts) == 5
+    assert sorted(p for p in model.client.prompts if not p.startswith("Answer each")) == ["a", "b", "c", "d"]